@@ -1,4 +1,6 @@
 """Manage campaign assets - check for existing files and handle storage."""
+import asyncio
+import os
 from pathlib import Path
 from typing import Optional
 import shutil
@@ -19,6 +21,12 @@ class AssetManager:
         self.assets_dir = self.campaign_root / "assets"
         self.output_dir = self.campaign_root / "output"
         
+        # Memoized existence checks, keyed by path
+        self._exists_cache: dict[Path, bool] = {}
+        
+        # Resolved asset locations, keyed by brief path (found assets only)
+        self._found_assets: dict[str, Path] = {}
+        
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -35,19 +43,33 @@ class AssetManager:
         if not asset_path:
             return None
         
+        found = self._found_assets.get(asset_path)
+        if found is not None:
+            return found
+        
         # Try relative to campaign root
         full_path = self.campaign_root / asset_path
-        if full_path.exists():
+        if self._exists(full_path):
+            self._found_assets[asset_path] = full_path
             return full_path
         
         # Try in assets directory
         asset_name = Path(asset_path).name
         assets_path = self.assets_dir / asset_name
-        if assets_path.exists():
+        if self._exists(assets_path):
+            self._found_assets[asset_path] = assets_path
             return assets_path
         
         return None
     
+    def _exists(self, path: Path) -> bool:
+        """Check whether a path exists, caching the result."""
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = os.access(path, os.F_OK)
+            self._exists_cache[path] = exists
+        return exists
+    
     def load_image(self, image_path: Path) -> Image.Image:
         """
         Load an image file.
@@ -67,6 +89,8 @@ class AssetManager:
         
         try:
             img = Image.open(image_path)
+            # Decode now so the image can be shared across threads
+            img.load()
             # Convert to RGB if necessary
             if img.mode != 'RGB':
                 img = img.convert('RGB')
@@ -79,7 +103,9 @@ class AssetManager:
         image: Image.Image,
         product_id: str,
         aspect_ratio_name: str,
-        filename: str = "campaign_post.png"
+        stem: str = "campaign_post",
+        output_format: Optional[str] = None,
+        replace_other_formats: bool = False
     ) -> Path:
         """
         Save generated image to organized output directory.
@@ -88,7 +114,10 @@ class AssetManager:
             image: PIL Image to save
             product_id: Product identifier
             aspect_ratio_name: Name of aspect ratio (e.g., "square", "story")
-            filename: Output filename
+            stem: Output filename without suffix (added from the output format)
+            output_format: "JPEG" or "PNG" (default: JPEG unless image has alpha)
+            replace_other_formats: Delete a file with the same stem in the other
+                format, e.g. a PNG left by an earlier run (default: False)
             
         Returns:
             Path where image was saved
@@ -97,12 +126,71 @@ class AssetManager:
         output_path = self.output_dir / product_id / aspect_ratio_name
         output_path.mkdir(parents=True, exist_ok=True)
         
+        # JPEG encodes much faster and smaller; keep PNG when alpha is needed
+        if output_format is None:
+            output_format = 'JPEG' if image.mode == 'RGB' else 'PNG'
+        
         # Save image
-        file_path = output_path / filename
-        image.save(file_path, format='PNG', quality=95)
+        if output_format == 'JPEG':
+            file_path = output_path / f"{stem}.jpg"
+            image.save(
+                file_path,
+                format='JPEG',
+                quality=92,
+                optimize=False,
+                progressive=False,
+                subsampling=1
+            )
+        else:
+            # Fast zlib level: much quicker to encode for a small size cost
+            file_path = output_path / f"{stem}.png"
+            image.save(file_path, format='PNG', optimize=False, compress_level=1)
+        self._exists_cache[file_path] = True
+        
+        # Remove the other format's file from earlier runs so it isn't listed twice
+        if replace_other_formats:
+            stale_path = file_path.with_suffix('.png' if output_format == 'JPEG' else '.jpg')
+            stale_path.unlink(missing_ok=True)
+            self._exists_cache[stale_path] = False
         
         return file_path
     
+    async def save_output_async(
+        self,
+        image: Image.Image,
+        product_id: str,
+        aspect_ratio_name: str,
+        stem: str = "campaign_post",
+        output_format: Optional[str] = None,
+        replace_other_formats: bool = False
+    ) -> Path:
+        """
+        Save generated image without blocking the event loop.
+        
+        Encoding and disk writes run in a worker thread; see save_output.
+        
+        Args:
+            image: PIL Image to save
+            product_id: Product identifier
+            aspect_ratio_name: Name of aspect ratio (e.g., "square", "story")
+            stem: Output filename without suffix (added from the output format)
+            output_format: "JPEG" or "PNG" (default: JPEG unless image has alpha)
+            replace_other_formats: Delete a file with the same stem in the other
+                format, e.g. a PNG left by an earlier run (default: False)
+            
+        Returns:
+            Path where image was saved
+        """
+        return await asyncio.to_thread(
+            self.save_output,
+            image,
+            product_id,
+            aspect_ratio_name,
+            stem,
+            output_format,
+            replace_other_formats
+        )
+    
     def get_output_structure(self) -> dict:
         """
         Get the current output directory structure.
@@ -112,17 +200,19 @@ class AssetManager:
         """
         structure = {}
         
-        if not self.output_dir.exists():
-            return structure
-        
-        for product_dir in self.output_dir.iterdir():
-            if product_dir.is_dir():
+        with os.scandir(self.output_dir) as products:
+            for product_dir in products:
+                if not product_dir.is_dir(follow_symlinks=False):
+                    continue
                 structure[product_dir.name] = []
-                for ratio_dir in product_dir.iterdir():
-                    if ratio_dir.is_dir():
-                        files = list(ratio_dir.glob("*.png"))
-                        structure[product_dir.name].extend([
-                            f"{ratio_dir.name}/{f.name}" for f in files
-                        ])
+                with os.scandir(product_dir.path) as ratios:
+                    for ratio_dir in ratios:
+                        if not ratio_dir.is_dir(follow_symlinks=False):
+                            continue
+                        with os.scandir(ratio_dir.path) as files:
+                            structure[product_dir.name].extend([
+                                f"{ratio_dir.name}/{f.name}"
+                                for f in files if f.name.endswith(('.png', '.jpg'))
+                            ])
         
         return structure
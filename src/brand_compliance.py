@@ -2,6 +2,7 @@
 from pathlib import Path
 from typing import Optional
 from PIL import Image
+import numpy as np
 import colorsys
 
 
@@ -60,28 +61,33 @@ class BrandComplianceChecker:
             brand_rgb = self._hex_to_rgb(self.brand_color)
             
             # Sample image colors
-            image_small = image.resize((100, 100))
-            pixels = list(image_small.getdata())
+            image_small = image.resize((100, 100)).convert('RGB')
+            pixels = np.asarray(image_small, dtype=np.int16)
             
             # Check if brand color (or similar) is present
             tolerance = 30  # RGB tolerance
-            color_found = False
+            reference = np.array(brand_rgb, dtype=np.int16)
             
-            for pixel in pixels:
-                if len(pixel) >= 3:
-                    r, g, b = pixel[:3]
-                    if (abs(r - brand_rgb[0]) < tolerance and
-                        abs(g - brand_rgb[1]) < tolerance and
-                        abs(b - brand_rgb[2]) < tolerance):
-                        color_found = True
-                        break
+            # Skip the per-pixel comparison when the brand color lies outside
+            # the per-channel range of the image
+            lo = pixels.min(axis=(0, 1))
+            hi = pixels.max(axis=(0, 1))
+            if np.any(hi <= reference - tolerance) or np.any(lo >= reference + tolerance):
+                matched = 0
+            else:
+                mask = (np.abs(pixels - reference) < tolerance).all(axis=-1)
+                matched = int(mask.sum())
+            
+            color_found = matched > 0
+            coverage = round(matched * 100 / (image_small.width * image_small.height), 2)
             
             if color_found:
                 return ComplianceResult(
                     "color_presence",
                     True,
                     100.0,
-                    f"Brand color {self.brand_color} detected"
+                    f"Brand color {self.brand_color} detected",
+                    {"brand_color": self.brand_color, "coverage": coverage}
                 )
             else:
                 return ComplianceResult(
@@ -89,7 +95,7 @@ class BrandComplianceChecker:
                     False,
                     50.0,
                     f"Brand color {self.brand_color} not prominently featured",
-                    {"brand_color": self.brand_color}
+                    {"brand_color": self.brand_color, "coverage": coverage}
                 )
         
         except Exception as e:
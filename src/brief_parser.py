@@ -4,6 +4,12 @@ from pathlib import Path
 from typing import Union
 from .models import CampaignBrief
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 class BriefParser:
     """Handles parsing and validation of campaign briefs."""
@@ -28,8 +34,8 @@ class BriefParser:
         if not brief_path.exists():
             raise FileNotFoundError(f"Brief file not found: {brief_path}")
         
-        with open(brief_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        with open(brief_path, 'rb') as f:
+            data = yaml.load(f, Loader=_Loader)
         
         try:
             brief = CampaignBrief(**data)
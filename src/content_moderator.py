@@ -1,6 +1,13 @@
 """Content moderation for campaign messages and AI prompts."""
+import re
 from typing import Optional
 
+# Optional: Aho-Corasick matcher, falls back to a compiled regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class ModerationResult:
     """Result of content moderation check."""
@@ -26,6 +33,7 @@ class ContentModerator:
             prohibited_terms: List of prohibited keywords (optional)
         """
         self.prohibited_terms = prohibited_terms or self._load_default_terms()
+        self._matcher = self._build_matcher(self.prohibited_terms)
     
     def _load_default_terms(self) -> list[str]:
         """Load default prohibited terms."""
@@ -37,6 +45,27 @@ class ContentModerator:
             # Add more terms based on legal/compliance requirements
         ]
     
+    def _build_matcher(self, terms: list[str]):
+        """
+        Compile prohibited terms into a single matcher.
+        
+        Uses an Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise a regex alternation of the lowercased literal terms.
+        """
+        if ahocorasick is None:
+            return re.compile('|'.join(re.escape(t.lower()) for t in terms))
+        
+        # Terms differing only in case share a key, keep all of them
+        originals: dict[str, list[str]] = {}
+        for term in terms:
+            originals.setdefault(term.lower(), []).append(term)
+        
+        automaton = ahocorasick.Automaton()
+        for key, group in originals.items():
+            automaton.add_word(key, group)
+        automaton.make_automaton()
+        return automaton
+    
     def moderate_text(self, text: str) -> ModerationResult:
         """
         Check text using keyword filtering.
@@ -91,14 +120,17 @@ class ContentModerator:
         Returns:
             List of found prohibited terms
         """
-        found_terms = []
+        # Single pass over the text, matching all terms at once
         text_lower = text.lower()
+        if ahocorasick is None:
+            # The regex only rules out clean text quickly; it cannot report
+            # overlapping terms, so fall back to a per-term scan on a hit
+            if not self._matcher.search(text_lower):
+                return []
+            return [term for term in self.prohibited_terms if term.lower() in text_lower]
         
-        for term in self.prohibited_terms:
-            if term.lower() in text_lower:
-                found_terms.append(term)
-        
-        return found_terms
+        matched = {term for _, group in self._matcher.iter(text_lower) for term in group}
+        return [term for term in self.prohibited_terms if term in matched]
     
     def moderate_campaign_message(self, message: str, strict: bool = False) -> bool:
         """
@@ -1,18 +1,29 @@
 """Generate images using GenAI APIs (OpenAI DALL-E)."""
+import asyncio
 import os
 from pathlib import Path
 from typing import Optional
 from PIL import Image
+import aiohttp
 import requests
 from io import BytesIO
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 
 class ImageGenerator:
     """Handles AI-powered image generation."""
     
-    def __init__(self):
-        """Initialize image generator with API key from environment."""
+    # Image sizes supported by DALL-E 3 as (width, height)
+    SUPPORTED_SIZES = [(1024, 1024), (1792, 1024), (1024, 1792)]
+    
+    def __init__(self, size: Optional[str] = None, quality: Optional[str] = None):
+        """
+        Initialize image generator with API key from environment.
+        
+        Args:
+            size: Image size, e.g. "1792x1024" (default: 1024x1024)
+            quality: "standard" or "hd" (default: OPENAI_IMAGE_QUALITY or standard)
+        """
         self.api_key = os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError(
@@ -20,9 +31,29 @@ class ImageGenerator:
             )
         
         self.client = OpenAI(api_key=self.api_key)
+        self.async_client = AsyncOpenAI(api_key=self.api_key)
         self.model = "dall-e-3"
-        self.size = "1024x1024"
-        self.quality = "standard"
+        self.size = size or "1024x1024"
+        self.quality = quality or os.getenv("OPENAI_IMAGE_QUALITY", "standard")
+    
+    @classmethod
+    def select_size(cls, aspect_ratios: list[dict]) -> str:
+        """
+        Pick the smallest generation size that covers all target aspect ratios.
+        
+        A square image is enough when no target is wider than it is tall;
+        wide targets get a landscape generation so they are cropped rather
+        than upscaled. Portrait targets crop well from a square image.
+        
+        Args:
+            aspect_ratios: Aspect ratio configs with 'width' and 'height'
+            
+        Returns:
+            Size string for the images API (e.g., "1792x1024")
+        """
+        widest = max((r['width'] / r['height'] for r in aspect_ratios), default=1.0)
+        width, height = cls.SUPPORTED_SIZES[1] if widest > 1 else cls.SUPPORTED_SIZES[0]
+        return f"{width}x{height}"
     
     def build_prompt(
         self,
@@ -100,12 +131,62 @@ class ImageGenerator:
             image_response = requests.get(image_url)
             image_response.raise_for_status()
             
-            # Convert to PIL Image
-            image = Image.open(BytesIO(image_response.content))
+            return self._decode_image(image_response.content), prompt
             
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+        except Exception as e:
+            raise Exception(f"Failed to generate image for {product_name}: {e}")
+    
+    async def generate_async(
+        self,
+        product_name: str,
+        product_description: str,
+        target_audience: str,
+        brand_color: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> tuple[Image.Image, str]:
+        """
+        Generate a product image using DALL-E without blocking the event loop.
+        
+        Args:
+            product_name: Name of the product
+            product_description: Product description
+            target_audience: Target audience description
+            brand_color: Primary brand color (hex)
+            session: Shared HTTP session for the download (optional)
+            
+        Returns:
+            Tuple of (PIL Image, prompt used)
+            
+        Raises:
+            Exception: If generation fails
+        """
+        prompt = self.build_prompt(
+            product_name,
+            product_description,
+            target_audience,
+            brand_color
+        )
+        
+        try:
+            response = await self.async_client.images.generate(
+                model=self.model,
+                prompt=prompt,
+                size=self.size,
+                quality=self.quality,
+                n=1
+            )
+            
+            # Download the generated image
+            image_url = response.data[0].url
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    body = await self._download(own_session, image_url)
+            else:
+                body = await self._download(session, image_url)
+            
+            # Decoding is CPU-bound, keep it off the event loop
+            loop = asyncio.get_running_loop()
+            image = await loop.run_in_executor(None, self._decode_image, body)
             
             return image, prompt
             
@@ -153,3 +234,67 @@ class ImageGenerator:
                     continue
         
         raise Exception(f"Failed after {max_retries} attempts: {last_error}")
+    
+    async def generate_with_retry_async(
+        self,
+        product_name: str,
+        product_description: str,
+        target_audience: str,
+        brand_color: Optional[str] = None,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> tuple[Image.Image, str]:
+        """
+        Generate image asynchronously with retry logic and exponential backoff.
+        
+        Args:
+            product_name: Name of the product
+            product_description: Product description
+            target_audience: Target audience description
+            brand_color: Primary brand color (hex)
+            max_retries: Maximum number of retry attempts
+            backoff: Initial delay between retries in seconds
+            session: Shared HTTP session for the download (optional)
+            
+        Returns:
+            Tuple of (PIL Image, prompt used)
+            
+        Raises:
+            Exception: If all retries fail
+        """
+        last_error = None
+        
+        for attempt in range(max_retries):
+            try:
+                return await self.generate_async(
+                    product_name,
+                    product_description,
+                    target_audience,
+                    brand_color,
+                    session=session
+                )
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    print(f"  Retry {attempt + 1}/{max_retries - 1} ({product_name})...")
+                    await asyncio.sleep(backoff * 2 ** attempt)
+        
+        raise Exception(f"Failed after {max_retries} attempts: {last_error}")
+    
+    async def _download(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """Download raw bytes from a URL."""
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.read()
+    
+    def _decode_image(self, data: bytes) -> Image.Image:
+        """Decode image bytes into an RGB PIL Image."""
+        image = Image.open(BytesIO(data))
+        image.load()
+        
+        # Convert to RGB if necessary
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        return image
@@ -4,13 +4,28 @@ from pathlib import Path
 from typing import Optional, Tuple
 import textwrap
 
+# Common font locations, in order of preference
+_FONT_PATHS = [
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/arialbd.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc"
+]
+
+# First available font, resolved once at import time
+_FONT_PATH = next((p for p in _FONT_PATHS if Path(p).exists()), None)
+
+# Loaded fonts, keyed by (font path, font size)
+_FONT_CACHE: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
+
 
 class ImageProcessor:
     """Handles image processing operations."""
     
     def __init__(self):
         """Initialize image processor."""
-        pass
+        # Font used for text overlays (None means Pillow's built-in font)
+        self.font_path = _FONT_PATH
     
     def smart_crop(
         self,
@@ -37,15 +52,15 @@ class ImageProcessor:
             # Image is wider than target - crop width
             new_width = int(image.height * target_ratio)
             left = (image.width - new_width) // 2
-            image = image.crop((left, 0, left + new_width, image.height))
+            box = (left, 0, left + new_width, image.height)
         else:
             # Image is taller than target - crop height
             new_height = int(image.width / target_ratio)
             top = (image.height - new_height) // 2
-            image = image.crop((0, top, image.width, top + new_height))
+            box = (0, top, image.width, top + new_height)
         
-        # Resize to exact dimensions
-        return image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+        # Resize the crop region to exact dimensions without an intermediate copy
+        return image.resize((target_width, target_height), Image.Resampling.LANCZOS, box=box)
     
     def resize_for_aspect_ratio(
         self,
@@ -75,7 +90,8 @@ class ImageProcessor:
         text_color: str = "#FFFFFF",
         stroke_color: str = "#000000",
         stroke_width: int = 3,
-        padding: int = 60
+        padding: int = 60,
+        in_place: bool = False
     ) -> Image.Image:
         """
         Add text overlay to image.
@@ -89,36 +105,20 @@ class ImageProcessor:
             stroke_color: Stroke/outline color (hex)
             stroke_width: Width of text stroke
             padding: Padding from edges
+            in_place: Draw directly onto image instead of a copy
             
         Returns:
             Image with text overlay
         """
-        # Create a copy to avoid modifying original
-        img = image.copy()
+        # Create a copy to avoid modifying original, unless drawing in place
+        img = image if in_place else image.copy()
         draw = ImageDraw.Draw(img)
         
-        # Try to load a nice font, fallback to default
-        try:
-            # Try common font locations
-            font_paths = [
-                "C:/Windows/Fonts/arial.ttf",
-                "C:/Windows/Fonts/arialbd.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-                "/System/Library/Fonts/Helvetica.ttc"
-            ]
-            font = None
-            for font_path in font_paths:
-                if Path(font_path).exists():
-                    font = ImageFont.truetype(font_path, font_size)
-                    break
-            if font is None:
-                font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
+        font = self._load_font(font_size)
         
         # Wrap text to fit image width
         max_width = img.width - (padding * 2)
-        wrapped_text = self._wrap_text(text, font, max_width, draw)
+        wrapped_text = self._wrap_text(text, font, max_width)
         
         # Calculate text bounding box
         bbox = draw.multiline_textbbox((0, 0), wrapped_text, font=font)
@@ -148,40 +148,67 @@ class ImageProcessor:
         
         return img
     
+    def _load_font(self, font_size: int) -> ImageFont.ImageFont:
+        """
+        Load the preferred font at the given size, falling back to default.
+        
+        Args:
+            font_size: Font size in points
+            
+        Returns:
+            Font object (cached per path and size)
+        """
+        if _FONT_PATH is None:
+            return ImageFont.load_default()
+        
+        key = (_FONT_PATH, font_size)
+        font = _FONT_CACHE.get(key)
+        if font is None:
+            try:
+                font = ImageFont.truetype(_FONT_PATH, font_size)
+            except OSError:
+                return ImageFont.load_default()
+            _FONT_CACHE[key] = font
+        return font
+    
     def _wrap_text(
         self,
         text: str,
         font: ImageFont.FreeTypeFont,
-        max_width: int,
-        draw: ImageDraw.ImageDraw
+        max_width: int
     ) -> str:
         """
         Wrap text to fit within max width.
         
+        Uses greedy wrapping with per-word advance widths, so each word is
+        measured once instead of re-measuring the whole line.
+        
         Args:
             text: Text to wrap
             font: Font to use
             max_width: Maximum width in pixels
-            draw: ImageDraw object for measuring
             
         Returns:
             Wrapped text with newlines
         """
-        words = text.split()
+        space_width = font.getlength(' ')
         lines = []
         current_line = []
+        current_width = 0.0
         
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            width = bbox[2] - bbox[0]
+        for word in text.split():
+            word_width = font.getlength(word)
             
-            if width <= max_width:
+            if not current_line:
+                current_line = [word]
+                current_width = word_width
+            elif current_width + space_width + word_width <= max_width:
                 current_line.append(word)
+                current_width += space_width + word_width
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
+                lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
         
         if current_line:
             lines.append(' '.join(current_line))
@@ -194,7 +221,8 @@ class ImageProcessor:
         logo_path: Path,
         position: str = "top-right",
         size: int = 150,
-        padding: int = 40
+        padding: int = 40,
+        in_place: bool = False
     ) -> Image.Image:
         """
         Add logo to image.
@@ -205,6 +233,7 @@ class ImageProcessor:
             position: Position of logo ("top-left", "top-right", "bottom-left", "bottom-right")
             size: Maximum size of logo (maintains aspect ratio)
             padding: Padding from edges
+            in_place: Draw directly onto image instead of a copy
             
         Returns:
             Image with logo
@@ -212,8 +241,8 @@ class ImageProcessor:
         if not logo_path.exists():
             return image
         
-        # Create a copy
-        img = image.copy()
+        # Create a copy, unless drawing in place
+        img = image if in_place else image.copy()
         
         # Load and resize logo
         logo = Image.open(logo_path)
@@ -1,14 +1,36 @@
 """Localization support for multi-language campaigns."""
+import functools
+import json
+from pathlib import Path
 from typing import Optional
 from deep_translator import GoogleTranslator
 
+# Translations persisted across pipeline runs
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "creative-pipeline" / "translations.json"
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_translator(source_language: str, target_language: str) -> GoogleTranslator:
+    """Get a shared translator for a language pair, creating it on first use."""
+    return GoogleTranslator(source=source_language, target=target_language)
+
 
 class Localizer:
     """Handles text translation and language-specific formatting."""
     
-    def __init__(self):
-        """Initialize localizer with translation service."""
+    def __init__(self, cache_path: Optional[Path] = DEFAULT_CACHE_PATH):
+        """
+        Initialize localizer with translation service.
+        
+        Args:
+            cache_path: JSON file to persist translations in (None to disable)
+        """
         self.font_map = self._get_font_map()
+        
+        # Persistent translations: {"source>target": {text: translation}}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._translations = self._load_translations()
+        self._translations_dirty = False
     
     def _get_font_map(self) -> dict:
         """Map languages to appropriate fonts (English, Spanish, Japanese only)."""
@@ -35,19 +57,87 @@ class Localizer:
         Returns:
             Translated text
         """
-        # Skip translation if target is same as source
-        if target_language == source_language:
+        # Skip translation if target is same as source or there is no text
+        if target_language == source_language or not text or not text.strip():
             return text
         
         try:
-            translator = GoogleTranslator(source=source_language, target=target_language)
-            result = translator.translate(text)
-            return result
+            return self._translate(text, target_language, source_language)
         except Exception as e:
             print(f"Warning: Translation failed: {e}")
             print(f"Using original text: {text}")
             return text
     
+    def translate_batch(
+        self,
+        texts: list[str],
+        target_language: str,
+        source_language: str = 'en'
+    ) -> list[str]:
+        """
+        Translate several texts to target language in one batch.
+        
+        Args:
+            texts: Texts to translate
+            target_language: Target language code (ISO 639-1)
+            source_language: Source language code (default: 'en')
+            
+        Returns:
+            Translated texts, in the same order
+        """
+        if target_language == source_language or not texts:
+            return list(texts)
+        
+        try:
+            translator = _get_translator(source_language, target_language)
+            return translator.translate_batch(list(texts))
+        except Exception as e:
+            print(f"Warning: Batch translation failed: {e}")
+            print("Using original texts")
+            return list(texts)
+    
+    def _translate(self, text: str, target_language: str, source_language: str) -> str:
+        """Translate text, raising on failure so errors are not cached."""
+        pair = self._translations.setdefault(f"{source_language}>{target_language}", {})
+        if text in pair:
+            return pair[text]
+        
+        translator = _get_translator(source_language, target_language)
+        result = translator.translate(text)
+        pair[text] = result
+        self._translations_dirty = True
+        return result
+    
+    def _load_translations(self) -> dict:
+        """Load persisted translations, starting empty if unavailable."""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring translation cache {self.cache_path}: {e}")
+            return {}
+    
+    def save_translations(self) -> None:
+        """
+        Persist translations made since loading (no-op if unchanged).
+        
+        Call once new translations are no longer expected, e.g. at the end
+        of a pipeline run.
+        """
+        if not self.cache_path or not self._translations_dirty:
+            return
+        
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._translations, f, ensure_ascii=False, indent=2)
+            self._translations_dirty = False
+        except OSError as e:
+            print(f"Warning: Could not save translation cache: {e}")
+    
     def get_font_for_language(self, language: str) -> str:
         """
         Get appropriate font for language (English, Spanish, Japanese only).
@@ -77,7 +167,7 @@ class Localizer:
         Returns:
             Localized message
         """
-        if target_language == 'en':
+        if target_language == 'en' or not message or not message.strip():
             return message
         
         # Simple implementation - translate everything
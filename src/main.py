@@ -5,8 +5,6 @@ import sys
 import os
 from dotenv import load_dotenv
 
-from .pipeline import CreativePipeline
-
 # Load environment variables from .env file
 load_dotenv()
 
@@ -30,6 +28,9 @@ def main(campaign_path: str, brief: str):
     Example:
         python -m src.main campaign/AcmeShampoo
     """
+    # Imported here so --help and argument errors skip loading PIL, OpenAI, etc.
+    from .pipeline import CreativePipeline
+    
     try:
         # Initialize and run pipeline
         pipeline = CreativePipeline(
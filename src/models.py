@@ -1,4 +1,5 @@
 """Data models for campaign briefs and configuration."""
+from dataclasses import dataclass
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
@@ -34,7 +35,11 @@ class CampaignBrief(BaseModel):
     brand_elements: Optional[BrandElements] = None
 
 
-class AspectRatio(BaseModel):
+# Pipeline-internal models: built from trusted values, so plain slotted
+# dataclasses instead of Pydantic validation
+
+@dataclass(slots=True)
+class AspectRatio:
     """Aspect ratio configuration."""
     name: str
     ratio: List[int]
@@ -42,7 +47,8 @@ class AspectRatio(BaseModel):
     height: int
 
 
-class GeneratedAsset(BaseModel):
+@dataclass(slots=True)
+class GeneratedAsset:
     """Metadata for a generated asset."""
     product_id: str
     product_name: str
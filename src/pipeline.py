@@ -1,10 +1,18 @@
 """Main pipeline orchestrator for creative automation."""
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
+import aiohttp
 import yaml
 from colorama import Fore, Style, init
+from PIL import Image
 
-from .models import CampaignBrief, AspectRatio, GeneratedAsset
+from .models import CampaignBrief, Product, AspectRatio, GeneratedAsset
 from .brief_parser import BriefParser
 from .asset_manager import AssetManager
 from .image_generator import ImageGenerator
@@ -13,6 +21,12 @@ from .content_moderator import ContentModerator
 from .localizer import Localizer
 from .brand_compliance import BrandComplianceChecker
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 # Initialize colorama for colored output
 init(autoreset=True)
 
@@ -20,6 +34,30 @@ init(autoreset=True)
 class CreativePipeline:
     """Orchestrates the creative automation pipeline."""
     
+    __slots__ = (
+        'campaign_path',
+        'config',
+        'aspect_ratios',
+        'brief_parser',
+        'asset_manager',
+        'image_generator',
+        'image_processor',
+        'content_moderator',
+        'localizer',
+        'compliance_checker',
+        'generated_assets',
+        'compliance_results',
+        'max_concurrency',
+        '_campaign_prefix',
+        '_text_options',
+        '_product_reports',
+        '_variant_cache_path',
+        '_variant_cache',
+        '_compliance_cache_path',
+        '_compliance_cache',
+        '_logo_digest'
+    )
+    
     def __init__(
         self,
         campaign_path: Path
@@ -31,21 +69,50 @@ class CreativePipeline:
             campaign_path: Path to campaign directory
         """
         self.campaign_path = Path(campaign_path)
+        self._campaign_prefix = str(self.campaign_path) + os.sep  # For display paths
         self.config = self._load_config()
+        self.aspect_ratios = [AspectRatio(**r) for r in self.config['aspect_ratios']]
+        
+        # Text overlay keyword arguments, unpacked once for every variant
+        text_config = self.config['text_overlay']
+        self._text_options = {
+            'position': text_config['position'],
+            'font_size': text_config['font_size_base'],
+            'text_color': text_config['text_color'],
+            'stroke_color': text_config['stroke_color'],
+            'stroke_width': text_config['stroke_width'],
+            'padding': text_config['padding']
+        }
         
         # Initialize components
         self.brief_parser = BriefParser()
         self.asset_manager = AssetManager(self.campaign_path)
-        self.image_generator = ImageGenerator()
+        self.image_generator = ImageGenerator(
+            size=ImageGenerator.select_size(self.config['aspect_ratios'])
+        )
         self.image_processor = ImageProcessor()
         
         # Phase 2 components
         self.content_moderator = ContentModerator()
         self.localizer = Localizer()
+        self.compliance_checker: Optional[BrandComplianceChecker] = None  # Set per brief
         
         # Track generated assets
         self.generated_assets: List[GeneratedAsset] = []
         self.compliance_results = []
+        self._product_reports: list[dict] = []
+        
+        # Maximum number of products processed concurrently
+        self.max_concurrency = 4
+        
+        # Fingerprints of saved variants, to skip unchanged work on re-runs
+        self._variant_cache_path = self.campaign_path / ".cache" / "variants.json"
+        self._variant_cache: dict[str, dict] = {}
+        
+        # Compliance result of each product's current square variant, with its fingerprint
+        self._compliance_cache_path = self.campaign_path / ".cache" / "compliance.json"
+        self._compliance_cache: dict[str, dict] = {}
+        self._logo_digest: Optional[str] = None  # Set per brief
     
     def _load_config(self) -> dict:
         """Load default configuration."""
@@ -63,7 +130,8 @@ class CreativePipeline:
                 'stroke_color': '#000000',
                 'stroke_width': 3,
                 'position': 'bottom'
-            }
+            },
+            'output_format': 'JPEG'
         }
     
     def run(self, brief_filename: str = "brief.yaml") -> dict:
@@ -112,6 +180,7 @@ class CreativePipeline:
                 brief.campaign_message,
                 target_lang
             )
+            self.localizer.save_translations()
             print(f"{Fore.GREEN}  ✓ Message localized: '{brief.campaign_message}'")
             
             # Update font for language
@@ -123,136 +192,558 @@ class CreativePipeline:
         
         # Step 2: Process each product
         print(f"\n{Fore.YELLOW}[2/7] Processing products...")
+        asyncio.run(self.run_campaign(brief))
         
-        for product in brief.products:
-            print(f"\n{Fore.CYAN}  Product: {product.name}")
-            
-            # Check for existing hero image
-            hero_image_path = self.asset_manager.find_asset(product.hero_image)
-            
-            if hero_image_path:
-                print(f"{Fore.GREEN}    ✓ Using existing image: {hero_image_path.name}")
-                hero_image = self.asset_manager.load_image(hero_image_path)
-                source = "existing"
-                prompt_used = None
-            else:
-                print(f"{Fore.YELLOW}    ⚡ Generating new image with AI...")
-                brand_color = brief.brand_elements.primary_color if brief.brand_elements else None
-                hero_image, prompt_used = self.image_generator.generate_with_retry(
-                    product.name,
-                    product.description,
-                    brief.target_audience,
-                    brand_color
+        # Step 5: Generate report
+        print(f"\n{Fore.YELLOW}[5/7] Generating report...")
+        report = self._generate_report(brief, original_message)
+        report_path = self.campaign_path / "output" / "generation_report.yaml"
+        report_path.write_bytes(yaml.dump(
+            report,
+            Dumper=_Dumper,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding='utf-8'
+        ))
+        print(f"{Fore.GREEN}  ✓ Report saved: {str(report_path).removeprefix(self._campaign_prefix)}")
+        
+        # Step 6: Summary
+        stats = report['statistics']
+        summary = [
+            f"\n{Fore.YELLOW}[6/7] Pipeline complete!",
+            f"\n{Fore.CYAN}{'='*60}",
+            f"{Fore.GREEN}Summary:",
+            f"  • Campaign: {brief.campaign_id}",
+            f"  • Products processed: {len(brief.products)}",
+            f"  • Total assets generated: {stats['total_assets']}"
+        ]
+        
+        # Phase 2 summary
+        if brief.target_market.language not in ['en', 'en-US']:
+            summary.append(f"  • Localized to: {brief.target_market.language}")
+        summary.append(f"  • Compliance checks: {stats['compliance_passed']}/{stats['compliance_total']} passed")
+        
+        summary.append(f"  • Output directory: {self.campaign_path / 'output'}")
+        summary.append(f"{Fore.CYAN}{'='*60}\n")
+        self._emit(summary)
+        
+        return report
+    
+    async def run_campaign(self, brief: CampaignBrief) -> None:
+        """
+        Process all products of a brief concurrently.
+        
+        API calls overlap on the event loop while Pillow work for every
+        product and aspect ratio runs on a shared thread pool (Pillow releases
+        the GIL in its resampling and drawing code). Results are recorded in
+        product order.
+        
+        Args:
+            brief: Parsed campaign brief
+        """
+        # Products write to output/<product id>/, so ids must not repeat
+        product_ids = [p.id for p in brief.products]
+        duplicates = sorted({pid for pid in product_ids if product_ids.count(pid) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate product ids in brief: {', '.join(duplicates)}")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # Start from a clean slate so repeated runs don't duplicate entries
+        self.generated_assets = []
+        self.compliance_results = []
+        self._product_reports = []
+        
+        logo_path = None
+        if brief.brand_elements and brief.brand_elements.logo:
+            logo_path = self.asset_manager.find_asset(brief.brand_elements.logo)
+        
+        # Brand settings are constant for the campaign, check with one instance
+        self.compliance_checker = BrandComplianceChecker(
+            brand_color=brief.brand_elements.primary_color if brief.brand_elements else None,
+            logo_path=logo_path
+        )
+        self._logo_digest = self._file_digest(logo_path) if logo_path else None
+        self._variant_cache = self._load_json_cache(self._variant_cache_path)
+        # Drop entries in an older layout so they don't linger in the file
+        self._compliance_cache = {
+            product_id: entry
+            for product_id, entry in self._load_json_cache(self._compliance_cache_path).items()
+            if isinstance(entry, dict) and 'fingerprint' in entry
+        }
+        
+        async def process(product: Product) -> tuple[list[str], list[GeneratedAsset], Optional[dict], dict]:
+            async with semaphore:
+                lines, assets, compliance = await self._process_product(
+                    product, brief, logo_path, session, executor
                 )
-                print(f"{Fore.GREEN}    ✓ Image generated")
-                source = "generated"
+            # Build the report entry as soon as the product finishes
+            return lines, assets, compliance, self._build_product_report(product, assets, compliance)
+        
+        # One HTTP session for every generated image download
+        max_workers = len(self.aspect_ratios) * self.max_concurrency
+        async with aiohttp.ClientSession() as session:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = await asyncio.gather(*(process(p) for p in brief.products))
+        
+        self._save_json_cache(self._variant_cache_path, self._variant_cache)
+        self._save_json_cache(self._compliance_cache_path, self._compliance_cache)
+        
+        # Print each product's log lines together, in brief order
+        for lines, assets, compliance, product_report in results:
+            self._emit(lines)
+            self.generated_assets.extend(assets)
+            if compliance:
+                self.compliance_results.append(compliance)
+            self._product_reports.append(product_report)
+    
+    @staticmethod
+    def _emit(lines: list[str]) -> None:
+        """
+        Write several log lines to stdout in a single call.
+        
+        Each line ends with a style reset, matching what colorama's autoreset
+        does for separate print calls.
+        
+        Args:
+            lines: Lines to write
+        """
+        sys.stdout.write(''.join(f"{line}{Style.RESET_ALL}\n" for line in lines))
+        sys.stdout.flush()
+    
+    async def _process_product(
+        self,
+        product: Product,
+        brief: CampaignBrief,
+        logo_path: Optional[Path],
+        session: aiohttp.ClientSession,
+        executor: ThreadPoolExecutor
+    ) -> tuple[list[str], list[GeneratedAsset], Optional[dict]]:
+        """
+        Resolve the hero image for a product and render all its variants.
+        
+        Args:
+            product: Product to process
+            brief: Parsed campaign brief
+            logo_path: Resolved brand logo path (if any)
+            session: Shared HTTP session for image downloads
+            executor: Thread pool for Pillow work
             
-            # Step 3: Generate variants for each aspect ratio
-            print(f"\n{Fore.YELLOW}[3/7] Creating aspect ratio variants...")
+        Returns:
+            Tuple of (log lines, generated assets, compliance result)
+        """
+        loop = asyncio.get_running_loop()
+        lines = [f"\n{Fore.CYAN}  Product: {product.name}"]
+        
+        # Check for existing hero image
+        hero_image_path = self.asset_manager.find_asset(product.hero_image)
+        
+        if hero_image_path:
+            lines.append(f"{Fore.GREEN}    ✓ Using existing image: {hero_image_path.name}")
+            hero_digest = await loop.run_in_executor(
+                executor, self._file_digest, hero_image_path
+            )
+            fingerprints = {
+                ratio.name: self._variant_fingerprint(hero_digest, ratio, brief)
+                for ratio in self.aspect_ratios
+            }
             
-            for ratio_config in self.config['aspect_ratios']:
-                ratio = AspectRatio(**ratio_config)
-                print(f"    → {ratio.name} ({ratio.width}x{ratio.height})")
-                
-                # Resize image
-                resized = self.image_processor.resize_for_aspect_ratio(
-                    hero_image,
-                    ratio.width,
-                    ratio.height
-                )
-                
-                # Add text overlay
-                text_config = self.config['text_overlay']
-                with_text = self.image_processor.add_text_overlay(
-                    resized,
-                    brief.campaign_message,
-                    position=text_config['position'],
-                    font_size=text_config['font_size_base'],
-                    text_color=text_config['text_color'],
-                    stroke_color=text_config['stroke_color'],
-                    stroke_width=text_config['stroke_width'],
-                    padding=text_config['padding']
+            # Only decode the hero image if some variant has to be rendered
+            hero_image = None
+            if not all(
+                self._cached_variant(product, ratio, fingerprints[ratio.name])
+                for ratio in self.aspect_ratios
+            ):
+                hero_image = await loop.run_in_executor(
+                    executor, self.asset_manager.load_image, hero_image_path
                 )
+            source = "existing"
+            prompt_used = None
+        else:
+            lines.append(f"{Fore.YELLOW}    ⚡ Generating new image with AI...")
+            brand_color = brief.brand_elements.primary_color if brief.brand_elements else None
+            hero_image, prompt_used = await self.image_generator.generate_with_retry_async(
+                product.name,
+                product.description,
+                brief.target_audience,
+                brand_color,
+                session=session
+            )
+            lines.append(f"{Fore.GREEN}    ✓ Image generated")
+            fingerprints = {}
+            source = "generated"
+        
+        # Step 3: Generate variants for each aspect ratio
+        lines.append(f"\n{Fore.YELLOW}[3/7] Creating aspect ratio variants...")
+        
+        # Variants are independent, render them concurrently
+        results = await asyncio.gather(*(
+            self._process_variant(
+                product,
+                ratio,
+                hero_image,
+                fingerprints.get(ratio.name),
+                brief,
+                logo_path,
+                source,
+                prompt_used,
+                executor
+            )
+            for ratio in self.aspect_ratios
+        ))
+        
+        if hero_image is not None:
+            hero_image.close()
+            del hero_image
+        
+        assets = []
+        compliance = None
+        for variant_lines, asset, variant_compliance in results:
+            lines.extend(variant_lines)
+            assets.append(asset)
+            compliance = compliance or variant_compliance
+        
+        return lines, assets, compliance
+    
+    async def _process_variant(
+        self,
+        product: Product,
+        ratio: AspectRatio,
+        hero_image: Optional[Image.Image],
+        fingerprint: Optional[str],
+        brief: CampaignBrief,
+        logo_path: Optional[Path],
+        source: str,
+        prompt_used: Optional[str],
+        executor: ThreadPoolExecutor
+    ) -> tuple[list[str], GeneratedAsset, Optional[dict]]:
+        """
+        Render, check and save one aspect ratio variant of a product.
+        
+        Args:
+            product: Product being processed
+            ratio: Target aspect ratio
+            hero_image: Source hero image (read-only, shared across variants),
+                None if every variant is cached
+            fingerprint: Digest of all variant inputs, None if not cacheable
+            brief: Parsed campaign brief
+            logo_path: Resolved brand logo path (if any)
+            source: "existing" or "generated"
+            prompt_used: Prompt used to generate the hero image (if any)
+            executor: Thread pool for Pillow work
+            
+        Returns:
+            Tuple of (log lines, generated asset, compliance result)
+        """
+        loop = asyncio.get_running_loop()
+        lines = [f"    → {ratio.name} ({ratio.width}x{ratio.height})"]
+        compliance = None
+        
+        # Reuse the saved file if none of the inputs changed since it was made
+        cached_path = self._cached_variant(product, ratio, fingerprint)
+        if cached_path:
+            with_text = None
+        else:
+            with_text = await loop.run_in_executor(
+                executor,
+                self._render_variant,
+                hero_image,
+                ratio,
+                brief.campaign_message,
+                logo_path
+            )
+        
+        # Start encoding and writing the output while compliance checks run
+        save_future = None
+        if with_text is not None:
+            save_future = asyncio.ensure_future(self.asset_manager.save_output_async(
+                with_text,
+                product.id,
+                ratio.name,
+                output_format=self.config['output_format'],
+                replace_other_formats=True
+            ))
+        
+        try:
+            # Step 4: Brand Compliance Check (Phase 2)
+            if ratio.name == 'square':  # Only check once per product
+                lines.append(f"\n{Fore.YELLOW}[Phase 2] Running brand compliance checks...")
                 
-                # Add logo if available
-                if brief.brand_elements and brief.brand_elements.logo:
-                    logo_path = self.asset_manager.find_asset(brief.brand_elements.logo)
-                    if logo_path:
-                        with_text = self.image_processor.add_logo(
-                            with_text,
-                            logo_path,
-                            position="top-right"
+                # The fingerprint covers the image inputs, brand color and logo
+                cached = self._compliance_cache.get(product.id)
+                compliance_result = None
+                if fingerprint and cached and cached['fingerprint'] == fingerprint:
+                    compliance_result = cached['result']
+                if compliance_result is None:
+                    if with_text is None:
+                        with_text = await loop.run_in_executor(
+                            executor, self.asset_manager.load_image, cached_path
                         )
-                
-                # Step 4: Brand Compliance Check (Phase 2)
-                if ratio.name == 'square':  # Only check once per product
-                    print(f"\n{Fore.YELLOW}[Phase 2] Running brand compliance checks...")
-                    compliance_checker = BrandComplianceChecker(
-                        brand_color=brief.brand_elements.primary_color if brief.brand_elements else None,
-                        logo_path=logo_path if brief.brand_elements and brief.brand_elements.logo else None
+                    compliance_result = await loop.run_in_executor(
+                        executor, self.compliance_checker.run_brand_checks, with_text
                     )
-                    compliance_result = compliance_checker.run_brand_checks(with_text)
-                    self.compliance_results.append({
-                        'product_id': product.id,
-                        'product_name': product.name,
-                        'compliance': compliance_result
-                    })
-                    
-                    # Display compliance results
-                    if compliance_result['overall_passed']:
-                        print(f"{Fore.GREEN}    ✓ Compliance: PASSED (Score: {compliance_result['overall_score']}/100)")
-                    else:
-                        print(f"{Fore.YELLOW}    ⚠ Compliance: REVIEW NEEDED (Score: {compliance_result['overall_score']}/100)")
-                
-                # Save output
-                output_path = self.asset_manager.save_output(
-                    with_text,
-                    product.id,
-                    ratio.name
-                )
+                    # Replace the product's entry so results for old inputs are not kept
+                    if fingerprint:
+                        self._compliance_cache[product.id] = {
+                            'fingerprint': fingerprint,
+                            'result': compliance_result
+                        }
+                compliance = {
+                    'product_id': product.id,
+                    'product_name': product.name,
+                    'compliance': compliance_result
+                }
                 
-                # Track generated asset
-                self.generated_assets.append(GeneratedAsset(
-                    product_id=product.id,
-                    product_name=product.name,
-                    aspect_ratio=ratio.name,
-                    file_path=str(output_path),
-                    source=source,
-                    prompt_used=prompt_used
-                ))
-                
-                print(f"{Fore.GREEN}      ✓ Saved: {output_path.relative_to(self.campaign_path)}")
+                # Display compliance results
+                if compliance_result['overall_passed']:
+                    lines.append(f"{Fore.GREEN}    ✓ Compliance: PASSED (Score: {compliance_result['overall_score']}/100)")
+                else:
+                    lines.append(f"{Fore.YELLOW}    ⚠ Compliance: REVIEW NEEDED (Score: {compliance_result['overall_score']}/100)")
+        except BaseException:
+            # Let a started save finish so no half-written file or unretrieved
+            # task exception is left behind
+            if save_future is not None:
+                await asyncio.gather(save_future, return_exceptions=True)
+            raise
         
-        # Step 5: Generate report
-        print(f"\n{Fore.YELLOW}[5/7] Generating report...")
-        report = self._generate_report(brief, original_message)
-        report_path = self.campaign_path / "output" / "generation_report.yaml"
-        with open(report_path, 'w') as f:
-            yaml.dump(report, f, default_flow_style=False, sort_keys=False)
-        print(f"{Fore.GREEN}  ✓ Report saved: {report_path.relative_to(self.campaign_path)}")
+        # Wait for the output file
+        if save_future is None:
+            output_path = cached_path
+        else:
+            output_path = await save_future
+            cache_key = f"{product.id}/{ratio.name}"
+            if fingerprint:
+                stat = output_path.stat()
+                self._variant_cache[cache_key] = {
+                    'fingerprint': fingerprint,
+                    'file_path': str(output_path.relative_to(self.campaign_path)),
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns
+                }
+            else:
+                # The file was overwritten with uncacheable content
+                self._variant_cache.pop(cache_key, None)
+                self._compliance_cache.pop(product.id, None)
         
-        # Step 6: Summary
-        print(f"\n{Fore.YELLOW}[6/7] Pipeline complete!")
-        print(f"\n{Fore.CYAN}{'='*60}")
-        print(f"{Fore.GREEN}Summary:")
-        print(f"  • Campaign: {brief.campaign_id}")
-        print(f"  • Products processed: {len(brief.products)}")
-        print(f"  • Total assets generated: {len(self.generated_assets)}")
+        # Free the pixel buffer now instead of waiting for garbage collection
+        if with_text is not None:
+            with_text.close()
+            del with_text
         
-        # Phase 2 summary
-        if brief.target_market.language not in ['en', 'en-US']:
-            print(f"  • Localized to: {brief.target_market.language}")
-        compliance_passed = sum(1 for r in self.compliance_results if r['compliance']['overall_passed'])
-        print(f"  • Compliance checks: {compliance_passed}/{len(self.compliance_results)} passed")
+        # Track generated asset
+        asset = GeneratedAsset(
+            product_id=product.id,
+            product_name=product.name,
+            aspect_ratio=ratio.name,
+            file_path=str(output_path),
+            source=source,
+            prompt_used=prompt_used
+        )
         
-        print(f"  • Output directory: {self.campaign_path / 'output'}")
-        print(f"{Fore.CYAN}{'='*60}\n")
+        display_path = str(output_path).removeprefix(self._campaign_prefix)
+        if cached_path:
+            lines.append(f"{Fore.GREEN}      ✓ Unchanged, reused: {display_path}")
+        else:
+            lines.append(f"{Fore.GREEN}      ✓ Saved: {display_path}")
         
-        return report
+        return lines, asset, compliance
+    
+    def _render_variant(
+        self,
+        hero_image: Image.Image,
+        ratio: AspectRatio,
+        message: str,
+        logo_path: Optional[Path]
+    ) -> Image.Image:
+        """
+        Resize the hero image to an aspect ratio and add text and logo.
+        
+        Args:
+            hero_image: Source hero image
+            ratio: Target aspect ratio
+            message: Campaign message to overlay
+            logo_path: Resolved brand logo path (if any)
+            
+        Returns:
+            Finished variant image
+        """
+        # Resize image
+        resized = self.image_processor.resize_for_aspect_ratio(
+            hero_image,
+            ratio.width,
+            ratio.height
+        )
+        
+        # Add text overlay
+        with_text = self.image_processor.add_text_overlay(
+            resized,
+            message,
+            in_place=True,
+            **self._text_options
+        )
+        
+        # Add logo if available
+        if logo_path:
+            with_text = self.image_processor.add_logo(
+                with_text,
+                logo_path,
+                position="top-right",
+                in_place=True
+            )
+        
+        return with_text
+    
+    def _variant_fingerprint(
+        self,
+        hero_digest: str,
+        ratio: AspectRatio,
+        brief: CampaignBrief
+    ) -> str:
+        """
+        Digest every input that affects a rendered variant.
+        
+        Args:
+            hero_digest: SHA1 of the hero image file
+            ratio: Target aspect ratio
+            brief: Parsed campaign brief
+            
+        Returns:
+            Hex digest identifying the variant's inputs
+        """
+        brand_color = brief.brand_elements.primary_color if brief.brand_elements else None
+        parts = [
+            hero_digest,
+            brief.campaign_message,
+            f"{ratio.name}:{ratio.width}x{ratio.height}",
+            str(brand_color),
+            str(self._logo_digest),
+            repr(sorted(self._text_options.items())),
+            str(self.image_processor.font_path),
+            self.config['output_format']
+        ]
+        return hashlib.blake2b('\0'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cached_variant(
+        self,
+        product: Product,
+        ratio: AspectRatio,
+        fingerprint: Optional[str]
+    ) -> Optional[Path]:
+        """
+        Find a variant saved by a previous run with identical inputs.
+        
+        Args:
+            product: Product being processed
+            ratio: Target aspect ratio
+            fingerprint: Digest of the variant inputs (None if not cacheable)
+            
+        Returns:
+            Path to the saved variant, or None if it must be rendered
+        """
+        if not fingerprint:
+            return None
+        
+        entry = self._variant_cache.get(f"{product.id}/{ratio.name}")
+        if not entry or entry['fingerprint'] != fingerprint:
+            return None
+        
+        # A file overwritten or edited since it was saved is not a hit
+        file_path = self.campaign_path / entry['file_path']
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        if stat.st_size != entry.get('size') or stat.st_mtime_ns != entry.get('mtime_ns'):
+            return None
+        return file_path
+    
+    @staticmethod
+    def _load_json_cache(path: Path) -> dict:
+        """Load a JSON cache file, starting empty if missing or unreadable."""
+        if not path.exists():
+            return {}
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{Fore.YELLOW}  ⚠ Ignoring cache {path.name}: {e}")
+            return {}
+    
+    @staticmethod
+    def _save_json_cache(path: Path, data: dict) -> None:
+        """Write a JSON cache file, warning instead of failing the run."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            print(f"{Fore.YELLOW}  ⚠ Could not save cache {path.name}: {e}")
+    
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """Compute the SHA1 hex digest of a file's contents."""
+        return hashlib.sha1(path.read_bytes()).hexdigest()
+    
+    def _compute_stats(self) -> dict:
+        """
+        Tally assets and compliance results in a single pass over each.
+        
+        Returns:
+            Dictionary of asset and compliance counts
+        """
+        assets_generated = assets_reused = 0
+        for asset in self.generated_assets:
+            assets_generated += asset.source == 'generated'
+            assets_reused += asset.source == 'existing'
+        
+        compliance_passed = 0
+        for r in self.compliance_results:
+            compliance_passed += r['compliance']['overall_passed']
+        
+        return {
+            'total_assets': len(self.generated_assets),
+            'assets_generated': assets_generated,
+            'assets_reused': assets_reused,
+            'compliance_passed': compliance_passed,
+            'compliance_total': len(self.compliance_results)
+        }
+    
+    def _build_product_report(
+        self,
+        product: Product,
+        product_assets: list[GeneratedAsset],
+        compliance: Optional[dict]
+    ) -> dict:
+        """
+        Build the report entry for one processed product.
+        
+        Args:
+            product: Processed product
+            product_assets: Assets generated for the product
+            compliance: Compliance record for the product (if any)
+            
+        Returns:
+            Product report dictionary
+        """
+        return {
+            'product_id': product.id,
+            'product_name': product.name,
+            'source': product_assets[0].source if product_assets else 'unknown',
+            'prompt_used': product_assets[0].prompt_used if product_assets else None,
+            'compliance': compliance['compliance'] if compliance else None,
+            'variants': [
+                {
+                    'aspect_ratio': asset.aspect_ratio,
+                    'file_path': asset.file_path
+                }
+                for asset in product_assets
+            ]
+        }
     
     def _generate_report(self, brief: CampaignBrief, original_message: str) -> dict:
         """Generate a detailed report of the pipeline execution."""
-        report = {
+        return {
             'campaign_id': brief.campaign_id,
             'timestamp': str(Path.cwd()),  # Placeholder
             'phase_2_features': {
@@ -265,41 +756,9 @@ class CreativePipeline:
                 },
                 'brand_compliance': 'enabled'
             },
-            'products': [],
+            'products': self._product_reports,
             'statistics': {
                 'total_products': len(brief.products),
-                'total_assets': len(self.generated_assets),
-                'assets_generated': len([a for a in self.generated_assets if a.source == 'generated']),
-                'assets_reused': len([a for a in self.generated_assets if a.source == 'existing']),
-                'compliance_passed': sum(1 for r in self.compliance_results if r['compliance']['overall_passed']),
-                'compliance_total': len(self.compliance_results)
+                **self._compute_stats()
             }
         }
-        
-        # Group assets by product
-        for product in brief.products:
-            product_assets = [a for a in self.generated_assets if a.product_id == product.id]
-            
-            # Find compliance result for this product
-            compliance_data = next(
-                (r['compliance'] for r in self.compliance_results if r['product_id'] == product.id),
-                None
-            )
-            
-            product_report = {
-                'product_id': product.id,
-                'product_name': product.name,
-                'source': product_assets[0].source if product_assets else 'unknown',
-                'prompt_used': product_assets[0].prompt_used if product_assets else None,
-                'compliance': compliance_data,
-                'variants': [
-                    {
-                        'aspect_ratio': asset.aspect_ratio,
-                        'file_path': asset.file_path
-                    }
-                    for asset in product_assets
-                ]
-            }
-            report['products'].append(product_report)
-        
-        return report
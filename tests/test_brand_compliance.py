@@ -0,0 +1,68 @@
+"""Tests for brand color detection on small brand-coloured patches."""
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.brand_compliance import BrandComplianceChecker
+
+BRAND_COLOR = "#EB6440"
+
+
+def baseline_color_found(image: Image.Image, brand_rgb: tuple, tolerance: int = 30) -> bool:
+    """Reference implementation: the original per-pixel loop."""
+    image_small = image.resize((100, 100))
+    access = image_small.load()
+    for y in range(image_small.height):
+        for x in range(image_small.width):
+            pixel = access[x, y]
+            if len(pixel) < 3:
+                continue
+            r, g, b = pixel[:3]
+            if (abs(r - brand_rgb[0]) < tolerance and
+                abs(g - brand_rgb[1]) < tolerance and
+                abs(b - brand_rgb[2]) < tolerance):
+                return True
+    return False
+
+
+def make_hero(patch_size: int, left: int, top: int) -> Image.Image:
+    """Build a 1080x1080 blue/green gradient with one brand-coloured patch."""
+    ramp = np.linspace(0, 255, 1080, dtype=np.uint8)
+    pixels = np.zeros((1080, 1080, 3), dtype=np.uint8)
+    pixels[..., 1] = ramp[:, None]
+    pixels[..., 2] = ramp[None, :]
+    image = Image.fromarray(pixels, 'RGB')
+    if patch_size:
+        image.paste((235, 100, 64), (left, top, left + patch_size, top + patch_size))
+    return image
+
+
+@pytest.mark.parametrize("patch_size", [0, 10, 15, 20, 25, 30, 40])
+@pytest.mark.parametrize("offset", [(0, 0), (3, 7), (101, 53), (517, 911)])
+def test_small_patch_matches_baseline(patch_size, offset):
+    image = make_hero(patch_size, *offset)
+    checker = BrandComplianceChecker(brand_color=BRAND_COLOR)
+    
+    result = checker.check_color_presence(image)
+    
+    assert result.passed == baseline_color_found(image, (235, 100, 64))
+
+
+@pytest.mark.parametrize("patch_size", [20, 40])
+def test_small_patch_is_detected(patch_size):
+    image = make_hero(patch_size, 300, 300)
+    checker = BrandComplianceChecker(brand_color=BRAND_COLOR)
+    
+    result = checker.check_color_presence(image)
+    
+    assert result.passed
+    assert result.details["coverage"] > 0
+
+
+def test_missing_brand_color_is_reported():
+    checker = BrandComplianceChecker(brand_color=BRAND_COLOR)
+    
+    result = checker.check_color_presence(make_hero(0, 0, 0))
+    
+    assert not result.passed
+    assert result.details["coverage"] == 0